@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Shared async HTTP client for the DemoQA Book Store API scripts.
+
+Description:
+    - Build the HTTP/2-enabled `httpx.AsyncClient` shared by every workflow script.
+    - Multiplex concurrent calls to `demoqa.com` over one TCP+TLS connection
+      through a small connection pool.
+    - Apply the JSON `Content-Type`/`Accept` headers and timeout once for all requests.
+    - Run a single script step on its own event loop when invoked standalone.
+    - Provide a helper that renders a short, decoded preview of a response body.
+    - Parse `.env` files and look up required values for the workflow scripts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import httpx
+
+
+SNIPPET_LENGTH = 512
+
+
+def create_client() -> httpx.AsyncClient:
+    """Return a new async client configured for the DemoQA API."""
+
+    # The workflow issues at most two concurrent requests, all to demoqa.com,
+    # so a small pool is enough; httpx does not retry by default.
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=2, max_keepalive_connections=1),
+    )
+
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=10.0,
+        headers={
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        },
+    )
+
+
+def run_standalone(step: Callable[[httpx.AsyncClient], Awaitable[None]]) -> None:
+    """Run a single script's `run(client)` coroutine with its own client."""
+
+    async def _run() -> None:
+        async with create_client() as client:
+            await step(client)
+
+    asyncio.run(_run())
+
+
+async def response_snippet(response: httpx.Response, limit: int = SNIPPET_LENGTH) -> str:
+    """Return at most `limit` bytes of the response body decoded as UTF-8.
+
+    Avoids decoding (or, for streamed responses, downloading) the whole body
+    when only a short preview is printed on an error path.
+    """
+
+    head = await anext(response.aiter_bytes(chunk_size=limit), b"")
+    return head[:limit].decode("utf-8", "replace")
+
+
+def load_env_values(env_path: Path) -> dict[str, str]:
+    """Return existing key/value pairs from a .env file if present."""
+
+    env_values: dict[str, str] = {}
+
+    if not env_path.exists():
+        return env_values
+
+    for line in env_path.read_text(encoding="utf-8").splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if "=" not in stripped:
+            continue
+        key, value = stripped.split("=", 1)
+        value = value.strip()
+        # `set_key` wraps values in quotes; strip them like python-dotenv does.
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        env_values[key.strip()] = value
+
+    return env_values
+
+
+def require_env_value(key: str, env_values: dict[str, str]) -> str:
+    """Return the value stored under `key`, exiting if it is missing or empty."""
+
+    value = env_values.get(key)
+    if not value:
+        print(f"Missing required environment variable: {key}")
+        sys.exit(1)
+    return value
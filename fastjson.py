@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Fastest-available JSON `loads`/`dumps` for the DemoQA scripts.
+
+Description:
+    - Prefer `orjson`, then `ujson`, then fall back to the standard library `json`.
+    - Expose `loads`, `dumps`, and `JSONDecodeError` with stdlib-compatible semantics:
+      `loads` accepts `bytes` or `str`, `dumps` returns `str` and honours
+      `indent`/`sort_keys`.
+"""
+
+from __future__ import annotations
+
+import json as _stdlib_json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the installed packages
+    _orjson = None
+
+try:
+    import ujson as _ujson
+except ImportError:  # pragma: no cover - depends on the installed packages
+    _ujson = None
+
+
+if _orjson is not None:
+    JSONDecodeError = _orjson.JSONDecodeError
+    loads = _orjson.loads
+
+    def dumps(obj: Any, *, indent: int | None = None, sort_keys: bool = False) -> str:
+        # orjson only supports two-space indentation.
+        if indent not in (None, 2):
+            return _stdlib_json.dumps(obj, indent=indent, sort_keys=sort_keys)
+
+        option = 0
+        if indent == 2:
+            option |= _orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        return _orjson.dumps(obj, option=option).decode("utf-8")
+
+elif _ujson is not None:
+    JSONDecodeError = ValueError
+    loads = _ujson.loads
+
+    def dumps(obj: Any, *, indent: int | None = None, sort_keys: bool = False) -> str:
+        return _ujson.dumps(obj, indent=indent or 0, sort_keys=sort_keys)
+
+else:
+    JSONDecodeError = _stdlib_json.JSONDecodeError
+    loads = _stdlib_json.loads
+
+    def dumps(obj: Any, *, indent: int | None = None, sort_keys: bool = False) -> str:
+        return _stdlib_json.dumps(obj, indent=indent, sort_keys=sort_keys)
@@ -13,52 +13,39 @@ Description:
 
 from __future__ import annotations
 
-import json
 import sys
+from os import getenv
 from pathlib import Path
 
-import requests
+import httpx
 from dotenv import load_dotenv
 
+from demoqa_client import response_snippet, run_standalone
+from fastjson import JSONDecodeError, loads
 
-DEMOQA_AUTHORIZED_URL = "https://demoqa.com/Account/v1/Authorized"
-
-
-def main() -> None:
-    env_path = Path(__file__).resolve().with_name(".env")
-
-    if not env_path.exists():
-        print(f"Missing environment file: {env_path}")
-        sys.exit(1)
-
-    load_dotenv(env_path)
 
-    from os import getenv
+DEMOQA_AUTHORIZED_URL = "https://demoqa.com/Account/v1/Authorized"
+_HERE = Path(__file__).resolve().parent
 
-    username = getenv("DEMOQA_USERNAME")
-    password = getenv("DEMOQA_PASSWORD")
 
-    if not username or not password:
-        print("DEMOQA_USERNAME and DEMOQA_PASSWORD must be set in the .env file.")
-        sys.exit(1)
+async def authorize_user(client: httpx.AsyncClient, username: str, password: str) -> None:
+    """Check the credentials against the Authorized endpoint, exiting on failure."""
 
     payload = {"userName": username, "password": password}
 
     try:
-        response = requests.post(
+        response = await client.post(
             DEMOQA_AUTHORIZED_URL,
-            headers={"Content-Type": "application/json"},
             json=payload,
-            timeout=10,
         )
-    except requests.RequestException as exc:
+    except httpx.HTTPError as exc:
         print(f"HTTP request failed: {exc}")
         sys.exit(1)
 
     if response.status_code == 200:
         try:
-            body = response.json()
-        except json.JSONDecodeError:
+            body = loads(response.content)
+        except JSONDecodeError:
             print("Response did not contain valid JSON data.")
             sys.exit(1)
 
@@ -70,10 +57,34 @@ def main() -> None:
             print(f"Unexpected response format: {body}")
             sys.exit(1)
     else:
-        print(f"Failed to verify authorization (status {response.status_code}): {response.text}")
+        snippet = await response_snippet(response)
+        print(f"Failed to verify authorization (status {response.status_code}): {snippet}")
         sys.exit(1)
 
 
+async def run(client: httpx.AsyncClient) -> None:
+    env_path = _HERE / ".env"
+
+    if not env_path.exists():
+        print(f"Missing environment file: {env_path}")
+        sys.exit(1)
+
+    load_dotenv(env_path, override=True)
+
+    username = getenv("DEMOQA_USERNAME")
+    password = getenv("DEMOQA_PASSWORD")
+
+    if not username or not password:
+        print("DEMOQA_USERNAME and DEMOQA_PASSWORD must be set in the .env file.")
+        sys.exit(1)
+
+    await authorize_user(client, username, password)
+
+
+def main() -> None:
+    run_standalone(run)
+
+
 if __name__ == "__main__":
     main()
 
@@ -17,23 +17,28 @@ Description:
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
-import requests
+import httpx
 import secrets
 import string
 
+from demoqa_client import load_env_values, response_snippet, run_standalone
+from fastjson import JSONDecodeError, loads
+
 
 DEMOQA_CREATE_USER_URL = "https://demoqa.com/Account/v1/User"
 
-ENV_FILE_PATH = Path(__file__).resolve().with_name(".env")
+_HERE = Path(__file__).resolve().parent
+ENV_FILE_PATH = _HERE / ".env"
 
 # Restrict the set of special characters to a safe subset that the API
 # accepts consistently.
 SPECIAL_CHARACTERS = "!@#$%&*"
 
+_ALPHABET = tuple(string.ascii_letters + string.digits + SPECIAL_CHARACTERS)
+
 
 def generate_secure_password(length: int = 12) -> str:
     """Return a random password that satisfies DemoQA's complexity rules.
@@ -46,18 +51,15 @@ def generate_secure_password(length: int = 12) -> str:
     if length < 8:
         raise ValueError("Password length must be at least 8 characters")
 
-    alphabet = string.ascii_letters + string.digits + SPECIAL_CHARACTERS
     system_random = secrets.SystemRandom()
 
     password_chars = [
-        secrets.choice(string.ascii_uppercase),
-        secrets.choice(string.ascii_lowercase),
-        secrets.choice(string.digits),
-        secrets.choice(SPECIAL_CHARACTERS),
+        system_random.choice(string.ascii_uppercase),
+        system_random.choice(string.ascii_lowercase),
+        system_random.choice(string.digits),
+        system_random.choice(SPECIAL_CHARACTERS),
     ]
-
-    for _ in range(length - len(password_chars)):
-        password_chars.append(secrets.choice(alphabet))
+    password_chars += system_random.choices(_ALPHABET, k=length - len(password_chars))
 
     system_random.shuffle(password_chars)
 
@@ -72,60 +74,44 @@ def generate_unique_username(base: str = "testuser", suffix_length: int = 10) ->
     return f"{base}{suffix}"
 
 
-def create_user(user_name: str, password: str) -> tuple[int, dict[str, str]]:
+async def create_user(
+    client: httpx.AsyncClient, user_name: str, password: str
+) -> tuple[int, dict[str, str]]:
     """Call the DemoQA Create User endpoint and return status code + payload."""
 
     payload = {"userName": user_name, "password": password}
 
-    response = requests.post(
+    response = await client.post(
         DEMOQA_CREATE_USER_URL,
-        headers={"Content-Type": "application/json"},
         json=payload,
-        timeout=10,
     )
 
     try:
-        data = response.json()
-    except json.JSONDecodeError:
-        data = {"message": response.text.strip() or "No response body returned"}
+        data = loads(response.content)
+    except JSONDecodeError:
+        snippet = (await response_snippet(response)).strip()
+        data = {"message": snippet or "No response body returned"}
 
     return response.status_code, data
 
 
-def load_env_values(env_path: Path) -> dict[str, str]:
-    """Return existing key/value pairs from a .env file if present."""
-
-    env_values: dict[str, str] = {}
-
-    if not env_path.exists():
-        return env_values
-
-    with env_path.open("r", encoding="utf-8") as env_file:
-        for line in env_file:
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            if "=" not in stripped:
-                continue
-            key, value = stripped.split("=", 1)
-            env_values[key.strip()] = value.strip()
-
-    return env_values
-
-
 def save_credentials_to_env(credentials: dict[str, str], env_path: Path = ENV_FILE_PATH) -> None:
     """Persist the provided credentials to the given .env file."""
 
-    existing_values = load_env_values(env_path)
-    existing_values.update(credentials)
+    merged = load_env_values(env_path)
+    merged.update(credentials)
 
-    with env_path.open("w", encoding="utf-8") as env_file:
-        for key, value in existing_values.items():
-            env_file.write(f"{key}={value}\n")
+    env_path.write_text(
+        "".join(f"{key}={value}\n" for key, value in merged.items()),
+        encoding="utf-8",
+    )
 
 
-def main() -> None:
-    """Generate credentials, print them, and attempt to create the user."""
+async def register_user(client: httpx.AsyncClient) -> tuple[str, str, str]:
+    """Generate credentials, create the user, and return username, password, user ID.
+
+    Exits the process if the API call fails or does not return HTTP 201.
+    """
 
     user_name = generate_unique_username()
     password = generate_secure_password()
@@ -134,31 +120,43 @@ def main() -> None:
     print(f"Generated password: {password}")
 
     try:
-        status_code, payload = create_user(user_name, password)
-    except requests.RequestException as exc:
+        status_code, payload = await create_user(client, user_name, password)
+    except httpx.HTTPError as exc:
         print(f"HTTP request failed: {exc}")
         sys.exit(1)
 
-    if status_code == 201:
-        user_id = payload.get("userID", "<missing userID>")
-        username_from_api = payload.get("username", user_name)
-        print("Successfully created user!")
-        print(f"userID: {user_id}")
-        print(f"username: {username_from_api}")
-
-        save_credentials_to_env(
-            {
-                "DEMOQA_USERNAME": username_from_api,
-                "DEMOQA_PASSWORD": password,
-                "DEMOQA_USER_ID": user_id,
-            }
-        )
-        print(f"Saved credentials to {ENV_FILE_PATH}")
-    else:
+    if status_code != 201:
         error_message = payload.get("message") or payload
         print(f"Failed to create user (status {status_code}): {error_message}")
         sys.exit(1)
 
+    user_id = payload.get("userID", "<missing userID>")
+    username_from_api = payload.get("username", user_name)
+    print("Successfully created user!")
+    print(f"userID: {user_id}")
+    print(f"username: {username_from_api}")
+
+    return username_from_api, password, user_id
+
+
+async def run(client: httpx.AsyncClient) -> None:
+    """Generate credentials, print them, and attempt to create the user."""
+
+    user_name, password, user_id = await register_user(client)
+
+    save_credentials_to_env(
+        {
+            "DEMOQA_USERNAME": user_name,
+            "DEMOQA_PASSWORD": password,
+            "DEMOQA_USER_ID": user_id,
+        }
+    )
+    print(f"Saved credentials to {ENV_FILE_PATH}")
+
+
+def main() -> None:
+    run_standalone(run)
+
 
 if __name__ == "__main__":
     main()
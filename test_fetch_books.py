@@ -6,71 +6,82 @@ Author: Otávio Augusto
 Date: 2025-10-19
 Description:
     - Query `/BookStore/v1/Books` to retrieve the catalog of books.
-    - Extract each book's ISBN and title, ignoring malformed entries.
+    - Stream-parse the response and extract each book's ISBN and title,
+      ignoring malformed entries.
     - Save the resulting mapping to `test_books.json` for later API calls.
     - Handle HTTP and parsing errors gracefully with descriptive messages.
 """
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
+from typing import AsyncIterable, AsyncIterator
 
-import requests
+import httpx
+import ijson
+
+from demoqa_client import response_snippet, run_standalone
+from fastjson import dumps
 
 
 BOOKS_ENDPOINT = "https://demoqa.com/BookStore/v1/Books"
-OUTPUT_FILE = Path(__file__).resolve().with_name("test_books.json")
+_HERE = Path(__file__).resolve().parent
+OUTPUT_FILE = _HERE / "test_books.json"
 
 
-def main() -> None:
-    try:
-        response = requests.get(
-            BOOKS_ENDPOINT,
-            headers={"Accept": "application/json"},
-            timeout=10,
-        )
-    except requests.RequestException as exc:
-        print(f"HTTP request failed: {exc}")
-        sys.exit(1)
+async def _iter_books(chunks: AsyncIterable[bytes]) -> AsyncIterator[object]:
+    """Yield each entry of the `books` array as its bytes arrive."""
 
-    if response.status_code != 200:
-        print(f"Failed to fetch books (status {response.status_code}): {response.text}")
-        sys.exit(1)
+    parsed = ijson.sendable_list()
+    parser = ijson.items_coro(parsed, "books.item", use_float=True)
+    async for chunk in chunks:
+        parser.send(chunk)
+        for book in parsed:
+            yield book
+        del parsed[:]
+    parser.close()
+    for book in parsed:
+        yield book
 
-    try:
-        payload = response.json()
-    except json.JSONDecodeError:
-        print("Response did not contain valid JSON data.")
-        sys.exit(1)
-
-    books = payload.get("books")
-    if not isinstance(books, list):
-        print("Unexpected response format: 'books' list missing.")
-        sys.exit(1)
 
+async def run(client: httpx.AsyncClient) -> None:
     isbn_to_title: dict[str, str] = {}
     pretty_details: list[str] = []
 
-    for book in books:
-        if not isinstance(book, dict):
-            continue
-        isbn = book.get("isbn")
-        title = book.get("title")
-        authors = book.get("author")
-
-        if isinstance(isbn, str) and isinstance(title, str):
-            isbn_to_title[isbn] = title
-
-            if isinstance(authors, str) and authors.strip():
-                author_str = authors.strip()
-            else:
-                author_str = "<no author provided>"
-
-            pretty_details.append(
-                f"ISBN: {isbn}\nTitle: {title}\nAuthors: {author_str}\n"
-            )
+    try:
+        async with client.stream("GET", BOOKS_ENDPOINT) as response:
+            if response.status_code != 200:
+                snippet = await response_snippet(response)
+                print(f"Failed to fetch books (status {response.status_code}): {snippet}")
+                sys.exit(1)
+
+            # Parse books one at a time straight off the socket instead of
+            # materializing the full catalog payload first.
+            async for book in _iter_books(response.aiter_bytes()):
+                if not isinstance(book, dict):
+                    continue
+                isbn = book.get("isbn")
+                title = book.get("title")
+                authors = book.get("author")
+
+                if isinstance(isbn, str) and isinstance(title, str):
+                    isbn_to_title[isbn] = title
+
+                    if isinstance(authors, str) and authors.strip():
+                        author_str = authors.strip()
+                    else:
+                        author_str = "<no author provided>"
+
+                    pretty_details.append(
+                        f"ISBN: {isbn}\nTitle: {title}\nAuthors: {author_str}\n"
+                    )
+    except httpx.HTTPError as exc:
+        print(f"HTTP request failed: {exc}")
+        sys.exit(1)
+    except ijson.JSONError:
+        print("Response did not contain valid JSON data.")
+        sys.exit(1)
 
     if not isbn_to_title:
         print("No books with valid ISBN and title entries found.")
@@ -80,12 +91,16 @@ def main() -> None:
     print("\n".join(pretty_details))
 
     OUTPUT_FILE.write_text(
-        json.dumps(isbn_to_title, indent=2, sort_keys=True),
+        dumps(isbn_to_title, indent=2, sort_keys=True),
         encoding="utf-8",
     )
     print(f"Saved {len(isbn_to_title)} books to {OUTPUT_FILE}")
 
 
+def main() -> None:
+    run_standalone(run)
+
+
 if __name__ == "__main__":
     main()
 
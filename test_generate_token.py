@@ -6,36 +6,71 @@ Author: Otávio Augusto
 Date: 2025-10-19
 Description:
     - Load the stored username and password from `.env`.
-    - Invoke the `/Account/v1/GenerateToken` endpoint using `requests`.
+    - Invoke the `/Account/v1/GenerateToken` endpoint using the shared `httpx` client.
     - Persist the returned token back into `.env` via `python-dotenv`'s `set_key`.
     - Emit informative messages for both success and failure paths.
 """
 
 from __future__ import annotations
 
-import json
 import sys
+from os import getenv
 from pathlib import Path
 
-import requests
+import httpx
 from dotenv import load_dotenv, set_key
 
+from demoqa_client import response_snippet, run_standalone
+from fastjson import JSONDecodeError, loads
+
 
 DEMOQA_GENERATE_TOKEN_URL = "https://demoqa.com/Account/v1/GenerateToken"
+_HERE = Path(__file__).resolve().parent
 
 
-def main() -> None:
+async def generate_token(client: httpx.AsyncClient, username: str, password: str) -> str:
+    """Request a token for the given credentials, exiting on failure."""
+
+    payload = {"userName": username, "password": password}
+
+    try:
+        response = await client.post(
+            DEMOQA_GENERATE_TOKEN_URL,
+            json=payload,
+        )
+    except httpx.HTTPError as exc:
+        print(f"HTTP request failed: {exc}")
+        sys.exit(1)
+
+    if response.status_code != 200:
+        snippet = await response_snippet(response)
+        print(f"Failed to generate token (status {response.status_code}): {snippet}")
+        sys.exit(1)
+
+    try:
+        data = loads(response.content)
+    except JSONDecodeError:
+        print("Response did not contain valid JSON data.")
+        sys.exit(1)
+
+    token = data.get("token")
+    if not token:
+        print("Token not found in the response payload.")
+        sys.exit(1)
+
+    return token
+
+
+async def run(client: httpx.AsyncClient) -> None:
     """Load credentials, request a token, and persist it to .env."""
 
-    env_path = Path(__file__).resolve().with_name(".env")
+    env_path = _HERE / ".env"
 
     if not env_path.exists():
         print(f"Missing environment file: {env_path}")
         sys.exit(1)
 
-    load_dotenv(env_path)
-
-    from os import getenv
+    load_dotenv(env_path, override=True)
 
     username = getenv("DEMOQA_USERNAME")
     password = getenv("DEMOQA_PASSWORD")
@@ -44,36 +79,14 @@ def main() -> None:
         print("DEMOQA_USERNAME and DEMOQA_PASSWORD must be set in the .env file.")
         sys.exit(1)
 
-    payload = {"userName": username, "password": password}
+    token = await generate_token(client, username, password)
 
-    try:
-        response = requests.post(
-            DEMOQA_GENERATE_TOKEN_URL,
-            headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=10,
-        )
-    except requests.RequestException as exc:
-        print(f"HTTP request failed: {exc}")
-        sys.exit(1)
+    set_key(str(env_path), "DEMOQA_TOKEN", token)
+    print("Successfully retrieved and saved token.")
 
-    if response.status_code == 200:
-        try:
-            data = response.json()
-        except json.JSONDecodeError:
-            print("Response did not contain valid JSON data.")
-            sys.exit(1)
-
-        token = data.get("token")
-        if not token:
-            print("Token not found in the response payload.")
-            sys.exit(1)
-
-        set_key(str(env_path), "DEMOQA_TOKEN", token)
-        print("Successfully retrieved and saved token.")
-    else:
-        print(f"Failed to generate token (status {response.status_code}): {response.text}")
-        sys.exit(1)
+
+def main() -> None:
+    run_standalone(run)
 
 
 if __name__ == "__main__":
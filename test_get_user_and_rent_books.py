@@ -16,46 +16,34 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-import requests
-from dotenv import load_dotenv
+import httpx
 
+from demoqa_client import load_env_values, require_env_value, run_standalone
 
-ACCOUNT_USER_URL_TEMPLATE = "https://demoqa.com/Account/v1/User/{user_id}"
 
+ACCOUNT_USER_URL_TEMPLATE = "https://demoqa.com/Account/v1/User/{user_id}"
+_HERE = Path(__file__).resolve().parent
 
-def _get_env_value(key: str) -> str:
-    from os import getenv
 
-    value = getenv(key)
-    if not value:
-        print(f"Missing required environment variable: {key}")
-        sys.exit(1)
-    return value
-
-
-def main() -> None:
-    base_dir = Path(__file__).resolve().parent
-    env_path = base_dir / ".env"
+async def run(client: httpx.AsyncClient) -> None:
+    env_path = _HERE / ".env"
 
     if not env_path.exists():
         print(f"Missing environment file: {env_path}")
         sys.exit(1)
 
-    load_dotenv(env_path)
+    env_values = load_env_values(env_path)
 
-    user_id = _get_env_value("DEMOQA_USER_ID")
-    token = _get_env_value("DEMOQA_TOKEN")
+    user_id = require_env_value("DEMOQA_USER_ID", env_values)
+    token = require_env_value("DEMOQA_TOKEN", env_values)
 
     url = ACCOUNT_USER_URL_TEMPLATE.format(user_id=user_id)
 
-    headers = {
-        "Accept": "application/json",
-        "Authorization": f"Bearer {token}",
-    }
+    headers = {"Authorization": f"Bearer {token}"}
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-    except requests.RequestException as exc:
+        response = await client.get(url, headers=headers)
+    except httpx.HTTPError as exc:
         print(f"HTTP request failed: {exc}")
         sys.exit(1)
 
@@ -67,6 +55,10 @@ def main() -> None:
         sys.exit(1)
 
 
+def main() -> None:
+    run_standalone(run)
+
+
 if __name__ == "__main__":
     main()
 
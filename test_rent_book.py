@@ -13,26 +13,18 @@ Description:
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 from random import sample
 
-import requests
-from dotenv import load_dotenv
+import httpx
 
-
-BOOKSTORE_ADD_BOOK_URL = "https://demoqa.com/BookStore/v1/Books"
+from demoqa_client import load_env_values, require_env_value, response_snippet, run_standalone
+from fastjson import JSONDecodeError, loads
 
 
-def _load_env_value(key: str, env_path: Path) -> str:
-    from os import getenv
-
-    value = getenv(key)
-    if not value:
-        print(f"Missing required environment variable: {key}")
-        sys.exit(1)
-    return value
+BOOKSTORE_ADD_BOOK_URL = "https://demoqa.com/BookStore/v1/Books"
+_HERE = Path(__file__).resolve().parent
 
 
 def _load_books(json_path: Path) -> dict[str, str]:
@@ -41,8 +33,8 @@ def _load_books(json_path: Path) -> dict[str, str]:
         sys.exit(1)
 
     try:
-        data = json.loads(json_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        data = loads(json_path.read_bytes())
+    except JSONDecodeError as exc:
         print(f"Failed to parse books file: {exc}")
         sys.exit(1)
 
@@ -53,58 +45,57 @@ def _load_books(json_path: Path) -> dict[str, str]:
     return data
 
 
-def main() -> None:
-    base_path = Path(__file__).resolve().parent
-    env_path = base_path / ".env"
-    books_path = base_path / "test_books.json"
+async def run(client: httpx.AsyncClient) -> None:
+    env_path = _HERE / ".env"
+    books_path = _HERE / "test_books.json"
 
     if not env_path.exists():
         print(f"Missing environment file: {env_path}")
         sys.exit(1)
 
-    load_dotenv(env_path)
+    env_values = load_env_values(env_path)
 
-    user_id = _load_env_value("DEMOQA_USER_ID", env_path)
-    token = _load_env_value("DEMOQA_TOKEN", env_path)
+    user_id = require_env_value("DEMOQA_USER_ID", env_values)
+    token = require_env_value("DEMOQA_TOKEN", env_values)
 
     books = _load_books(books_path)
-    isbns = list(books.keys())
 
-    if len(isbns) < 2:
+    if len(books) < 2:
         print("Books file must contain at least two ISBN entries to proceed.")
         sys.exit(1)
 
-    selected_isbns = sample(isbns, 2)
+    selected_isbns = sample(list(books), 2)
 
     payload = {
         "userId": user_id,
         "collectionOfIsbns": [{"isbn": isbn} for isbn in selected_isbns],
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Authorization": f"Bearer {token}",
-    }
+    headers = {"Authorization": f"Bearer {token}"}
 
     try:
-        response = requests.post(
+        response = await client.post(
             BOOKSTORE_ADD_BOOK_URL,
             headers=headers,
             json=payload,
-            timeout=10,
         )
-    except requests.RequestException as exc:
+    except httpx.HTTPError as exc:
         print(f"HTTP request failed: {exc}")
         sys.exit(1)
 
     print("Response status:", response.status_code)
     print("Response body:")
-    print(response.text)
 
     if response.status_code not in {200, 201}:
+        print(await response_snippet(response))
         sys.exit(1)
 
+    print(response.text)
+
+
+def main() -> None:
+    run_standalone(run)
+
 
 if __name__ == "__main__":
     main()
@@ -6,85 +6,186 @@ Author: Otávio Augusto
 Date: 2025-10-19
 Description:
     - Maintain the ordered list of DemoQA workflow scripts to execute.
-    - Run each script via the current Python interpreter, halting on failure.
+    - Import each script and await its `run(client)` coroutine in-process with a
+      single shared async HTTP client, halting on failure.
+    - Run independent scripts (account setup, book catalog) concurrently on one
+      event loop.
     - Provide console feedback for script start/completion and overall success.
 """
 
 from __future__ import annotations
 
-import subprocess
+import asyncio
+import importlib
+import io
 import sys
 import time
+from contextvars import ContextVar
 from pathlib import Path
+from typing import TextIO
 
+import httpx
 
-def run_script(script_path: Path) -> dict[str, object]:
-    """Execute the given Python script using the current interpreter."""
+from demoqa_client import create_client
+
+
+_HERE = Path(__file__).resolve().parent
+
+# Buffer that receives the current step's console output while it runs
+# concurrently with other steps; None means write straight to the console.
+_step_output: ContextVar[io.StringIO | None] = ContextVar("_step_output", default=None)
+
+
+class _StepStdout(io.TextIOBase):
+    """Route writes to the running step's buffer, or to the real stream."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = _step_output.get()
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+async def run_script(
+    module_name: str, client: httpx.AsyncClient, buffered: bool = False
+) -> dict[str, object]:
+    """Import the given workflow module and await its `run(client)` in-process.
+
+    When `buffered` is set, the step's output is held back and printed under
+    its banner once the step finishes, so concurrent steps do not interleave.
+    """
 
     separator = "#" * 72
-    print(f"\n{separator}")
-    print(f"\nRunning {script_path.name}...")
+    banner = f"\n{separator}\n\nRunning {module_name}.py...\n"
+    output = io.StringIO() if buffered else None
+    if output is None:
+        sys.stdout.write(banner)
 
+    output_token = _step_output.set(output)
     start = time.perf_counter()
-    result = subprocess.run(
-        [sys.executable, str(script_path)],
-        cwd=script_path.parent,
-        check=False,
-    )
+    try:
+        await importlib.import_module(module_name).run(client)
+    except SystemExit as exc:
+        exit_code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+        details = f"Exited with code {exit_code}"
+    except Exception as exc:  # pylint: disable=broad-except
+        exit_code = 1
+        details = f"Raised {type(exc).__name__}: {exc}"
+    else:
+        exit_code = 0
+    finally:
+        _step_output.reset(output_token)
     duration = time.perf_counter() - start
 
+    if output is not None:
+        sys.stdout.write(banner + output.getvalue())
+
+    if exit_code == 0:
+        details = "Completed successfully"
+
     return {
-        "scenario": script_path.name,
-        "success": result.returncode == 0,
+        "scenario": f"{module_name}.py",
+        "success": exit_code == 0,
         "duration": duration,
-        "details": (
-            "Completed successfully"
-            if result.returncode == 0
-            else f"Exited with code {result.returncode}"
-        ),
+        "details": details,
     }
 
 
+async def run_stage(
+    module_names: list[str], client: httpx.AsyncClient
+) -> list[dict[str, object]]:
+    """Run the given independent modules concurrently and return their outcomes."""
+
+    results = await asyncio.gather(
+        *(run_script(name, client, buffered=len(module_names) > 1) for name in module_names),
+        return_exceptions=True,
+    )
+
+    # run_script already turns script failures into outcomes; anything that
+    # still escapes is recorded without cancelling the sibling steps.
+    outcomes: list[dict[str, object]] = []
+    for name, result in zip(module_names, results):
+        if isinstance(result, BaseException):
+            outcomes.append(
+                {
+                    "scenario": f"{name}.py",
+                    "success": False,
+                    "duration": 0.0,
+                    "details": f"Raised {type(result).__name__}: {result}",
+                }
+            )
+        else:
+            outcomes.append(result)
+
+    return outcomes
+
+
+async def run_stages(ordered_stages: list[list[str]]) -> list[dict[str, object]]:
+    """Run each stage in order over one shared client, stopping after a failure."""
+
+    summary: list[dict[str, object]] = []
+
+    console = sys.stdout
+    sys.stdout = _StepStdout(console)
+    try:
+        async with create_client() as client:
+            for stage in ordered_stages:
+                outcomes = await run_stage(stage, client)
+                summary.extend(outcomes)
+                if not all(outcome["success"] for outcome in outcomes):
+                    break
+    finally:
+        sys.stdout = console
+
+    return summary
+
+
 def main() -> None:
-    base_dir = Path(__file__).resolve().parent
-
-    ordered_scripts = [
-        base_dir / "test_create_user.py",
-        base_dir / "test_generate_token.py",
-        base_dir / "test_authorize_user.py",
-        base_dir / "test_fetch_books.py",
-        base_dir / "test_rent_book.py",
-        base_dir / "test_get_user_and_rent_books.py",
+    # Each stage lists scripts that do not depend on one another and may run
+    # concurrently; stages themselves run strictly in order.
+    ordered_stages = [
+        ["workflow", "test_fetch_books"],
+        ["test_rent_book"],
+        ["test_get_user_and_rent_books"],
     ]
 
-    summary: list[dict[str, object]] = []
+    for stage in ordered_stages:
+        for module_name in stage:
+            script = _HERE / f"{module_name}.py"
+            if not script.exists():
+                raise FileNotFoundError(f"Required script not found: {script}")
 
-    for script in ordered_scripts:
-        if not script.exists():
-            raise FileNotFoundError(f"Required script not found: {script}")
-        outcome = run_script(script)
-        summary.append(outcome)
-        if not outcome["success"]:
-            break
+    if str(_HERE) not in sys.path:
+        sys.path.insert(0, str(_HERE))
+
+    summary = asyncio.run(run_stages(ordered_stages))
 
     separator = "#" * 72
-    print(f"\n{separator}")
-    print("Execution summary:")
+    out: list[str] = [f"\n{separator}", "Execution summary:"]
     for entry in summary:
         scenario = entry["scenario"]
         duration = entry["duration"]
         success = entry["success"]
         details = entry["details"]
-        print(f"- Scenario: {scenario}")
-        print(f"  Duration: {duration:.2f} seconds")
-        print(f"  Outcome: {'Success' if success else 'Failure'}")
+        out.append(f"- Scenario: {scenario}")
+        out.append(f"  Duration: {duration:.2f} seconds")
+        out.append(f"  Outcome: {'Success' if success else 'Failure'}")
         if not success:
-            print(f"  Details: {details}")
+            out.append(f"  Details: {details}")
 
-    if all(entry["success"] for entry in summary) and summary:
-        print("\nAll DemoQA scripts executed successfully.")
+    succeeded = all(entry["success"] for entry in summary) and bool(summary)
+    if succeeded:
+        out.append("\nAll DemoQA scripts executed successfully.")
     else:
-        print("\nAt least one DemoQA script failed.")
+        out.append("\nAt least one DemoQA script failed.")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+    if not succeeded:
         sys.exit(1)
 
 
@@ -94,4 +195,3 @@ if __name__ == "__main__":
     except Exception as exc:  # pylint: disable=broad-except
         print(f"Execution failed: {exc}")
         sys.exit(1)
-
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Create, tokenize, and authorize a DemoQA user in a single pass.
+
+Description:
+    - Create a new DemoQA user with freshly generated credentials.
+    - Request an authentication token and verify authorization using the
+      in-memory credentials instead of reloading them from `.env`.
+    - Persist the username, password, user ID, and token (if obtained) to `.env`
+      in one write, even when a later step fails, so the created account is not lost.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+from demoqa_client import run_standalone
+from test_authorize_user import authorize_user
+from test_create_user import ENV_FILE_PATH, register_user, save_credentials_to_env
+from test_generate_token import generate_token
+
+
+async def run(client: httpx.AsyncClient) -> None:
+    """Run the create-user, generate-token, and authorize steps back to back."""
+
+    user_name, password, user_id = await register_user(client)
+
+    credentials = {
+        "DEMOQA_USERNAME": user_name,
+        "DEMOQA_PASSWORD": password,
+        "DEMOQA_USER_ID": user_id,
+        # Blank out any token left over from a previous user until a new one
+        # is issued.
+        "DEMOQA_TOKEN": "",
+    }
+
+    # The account now exists on the server, so persist whatever was obtained
+    # even if a later step exits early.
+    try:
+        credentials["DEMOQA_TOKEN"] = await generate_token(client, user_name, password)
+        print("Successfully retrieved token.")
+
+        await authorize_user(client, user_name, password)
+    finally:
+        save_credentials_to_env(credentials)
+        print(f"Saved credentials to {ENV_FILE_PATH}")
+
+
+def main() -> None:
+    run_standalone(run)
+
+
+if __name__ == "__main__":
+    main()